@@ -29,5 +29,8 @@ if __name__ == "__main__":
     # Analysis and plotting
     jd_0 = jd_0_from_epoch_ts(EPOCH_TIMESTAMP, 2023)
     process_encounters(t, y, jd_0)
-    plot_from_array(t, y)
-    plot_3d_from_array(t, y, 3)
+
+    # Plotting only needs single precision; keep float64 y for the analysis
+    y_plot = y.astype(np.float32, copy=False)
+    plot_from_array(t, y_plot)
+    plot_3d_from_array(t, y_plot, 3)
@@ -4,16 +4,18 @@ from datetime import datetime
 
 import numpy as np
 from celest import units as u
-from celest.coordinates import GCRS, ITRS, Coordinate, GroundLocation
-from celest.encounter import generate_vtws
-from celest.satellite import Satellite
+from celest.coordinates import AzEl, GCRS, ITRS, Coordinate, GroundLocation
 from celest.time import Time
 
 from hermes.constants import (
+    OMEGA_EARTH,
     TORONTO_GS_OCCULSION_ANGLE,
     TORONTO_GS,
 )
 
+# Maximum number of samples converted to AzEl at once in process_encounters
+ELEVATION_CHUNK_SIZE = 2**18
+
 
 def jd2000_to_datetime(jd2000: u.Quantity) -> datetime:
     # length-1 quanitity only
@@ -25,6 +27,8 @@ def ecef_to_eci(y_ecef: np.ndarray, jd: float) -> np.ndarray:
     Convert ECEF coordinates to ECI coordinates using celest,
     in a manner which can be used by supernova.
 
+    Single-state wrapper around `ecef_to_eci_batch`.
+
     Parameters
     ----------
     y_ecef : np.ndarray
@@ -37,40 +41,48 @@ def ecef_to_eci(y_ecef: np.ndarray, jd: float) -> np.ndarray:
     np.ndarray
         ECI coordinates in the form [x, y, z, x_dot, y_dot, z_dot]
     """
-    pos_ecef = Coordinate(
-        ITRS(
-            np.array([jd]),
-            np.array([y_ecef[0]]),
-            np.array([y_ecef[1]]),
-            np.array([y_ecef[2]]),
-            u.m,
-        )
-    )
-    vel_ecef = Coordinate(
-        ITRS(
-            np.array([jd]),
-            np.array([y_ecef[3]]),
-            np.array([y_ecef[4]]),
-            np.array([y_ecef[5]]),
-            u.m / u.s,
-        )
-    )
+    return ecef_to_eci_batch(np.asarray(y_ecef)[np.newaxis], np.array([jd]))[0]
 
-    pos_eci = pos_ecef.convert_to(GCRS)
-    vel_eci = vel_ecef.convert_to(GCRS)
 
-    state_dirty: list[u.Quantity] = [
-        pos_eci.x,
-        pos_eci.y,
-        pos_eci.z,
-        vel_eci.x,
-        vel_eci.y,
-        vel_eci.z,
-    ]
+def ecef_to_eci_batch(y_ecef: np.ndarray, jd: np.ndarray) -> np.ndarray:
+    """
+    Convert a series of ECEF states to ECI coordinates using celest.
 
-    state_clean: list[float] = [q.data[0] for q in state_dirty]
+    The ECEF velocity is taken relative to the rotating Earth, so the
+    Earth rotation term is added to the rotated velocity.
 
-    return np.array(state_clean)
+    Parameters
+    ----------
+    y_ecef : np.ndarray
+        ECEF states in the form [x, y, z, x_dot, y_dot, z_dot], of shape (n, 6)
+    jd : np.ndarray
+        Julian dates in the JD2000 epoch, of shape (n,)
+
+    Returns
+    -------
+    np.ndarray
+        ECI states in the form [x, y, z, x_dot, y_dot, z_dot], of shape (n, 6)
+    """
+    y_ecef = np.asarray(y_ecef, dtype=np.float64)
+    jd = np.asarray(jd, dtype=np.float64)
+    n = len(jd)
+
+    # transport term for the rotating ECEF frame; Earth spins about ITRS z.
+    # Since R(w x r) = (Rw) x (Rr), it can be added before rotating, so only
+    # the position and inertial velocity go through celest.
+    r_ecef = y_ecef[:, :3]
+    v_inertial = y_ecef[:, 3:] + np.cross([0.0, 0.0, OMEGA_EARTH], r_ecef)
+
+    points = np.vstack((r_ecef, v_inertial))
+    points_eci = Coordinate(
+        ITRS(np.concatenate((jd, jd)), points[:, 0], points[:, 1], points[:, 2], u.m)
+    ).convert_to(GCRS)
+    points_eci = points_eci.to_numpy(u.m)
+
+    r_eci = points_eci[:n]
+    v_eci = points_eci[n:]
+
+    return np.hstack((r_eci, v_eci))
 
 
 def process_encounters(
@@ -90,37 +102,40 @@ def process_encounters(
     t : np.ndarray
         mission elapsed time in seconds, of shape (n,)
     y : np.ndarray
-        state vector in the form [x, y, z, x_dot, y_dot, z_dot], of shape (n, 6)
+        state vector in the form [x, y, z, x_dot, y_dot, z_dot], of shape (n, 6).
+        Visibility only depends on position, so an (n, 3) array also works.
     jd_0 : float
         Julian date in the JD2000 epoch.
     cutoff_angles : list[float]
         List of cutoff angles in degrees, for which to generate VTWS.
     location : GroundLocation
         Ground location to generate VTWS for.
-    """
-    # Celest stuff
-    julian = Time(t / 86400, offset=jd_0)
 
-    position = GCRS(julian.julian.data, y[:, 0], y[:, 1], y[:, 2], u.m)
-    velocity = GCRS(julian.julian.data, y[:, 3], y[:, 4], y[:, 5], u.m / u.s)
+    Notes
+    -----
+    Rise and set times are linearly interpolated between the samples
+    on either side of each threshold crossing.
+    """
+    julian = Time(t / 86400, offset=jd_0).julian.data
 
-    # pos_aa = Coordinate(position).convert_to("AzEl", toronto)
-    # pos_itrs = Coordinate(position).convert_to(ITRS)
+    # The elevation series does not depend on the cutoff angle, so the
+    # AzEl conversion is done once and thresholded per cutoff angle.
+    elevation = _elevation_series(julian, y, location)
 
-    # plot_from_array(t, pos_itrs.data)
+    for cutoff_angle in cutoff_angles:
+        if cutoff_angle < 0 or 90 < cutoff_angle:
+            raise ValueError("cutoff angles must be between 0 and 90 degrees.")
 
-    satellite = Satellite(position=position, velocity=velocity)
+        rise_jds, set_jds = _visible_windows(julian, elevation, cutoff_angle)
 
-    for cutoff_angle in cutoff_angles:
-        # Generate ground location windows.
-        downlinking_windows = generate_vtws(
-            satellite=satellite, location=location, vis_threshold=cutoff_angle
-        )
+        if len(rise_jds) == 0:
+            continue
 
-        for idx, window in enumerate(downlinking_windows):
-            rise_time = jd2000_to_datetime(window.rise_time)
-            set_time = jd2000_to_datetime(window.set_time)
+        # Convert all window bounds to datetimes in one celest call each
+        rise_times = Time(rise_jds).datetime()
+        set_times = Time(set_jds).datetime()
 
+        for idx, (rise_time, set_time) in enumerate(zip(rise_times, set_times)):
             duration = (set_time - rise_time).total_seconds()
 
             rise_str = rise_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -130,3 +145,73 @@ def process_encounters(
                 f"[{cutoff_angle:.2f} DEG] Encounter {idx}"
                 f": {rise_str} to {set_str} ({duration:.2f} sec)"
             )
+
+
+def _elevation_series(
+    julian: np.ndarray, y: np.ndarray, location: GroundLocation
+) -> np.ndarray:
+    """
+    Elevation angles in degrees of GCRS positions, as seen from a location.
+
+    Long propagations are converted in chunks of ELEVATION_CHUNK_SIZE samples;
+    windows spanning chunk boundaries are unaffected since thresholding uses
+    the full series.
+    """
+    elevation = np.empty(len(julian))
+    for start in range(0, len(julian), ELEVATION_CHUNK_SIZE):
+        chunk = slice(start, start + ELEVATION_CHUNK_SIZE)
+        position = GCRS(julian[chunk], y[chunk, 0], y[chunk, 1], y[chunk, 2], u.m)
+        azel = Coordinate(position).convert_to(AzEl, location)
+        elevation[chunk] = azel.elevation.to(u.deg)
+
+    return elevation
+
+
+def _visible_windows(
+    julian: np.ndarray, elevation: np.ndarray, vis_threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the time windows where the elevation exceeds a threshold.
+
+    Parameters
+    ----------
+    julian : np.ndarray
+        Julian dates in the JD2000 epoch, of shape (n,)
+    elevation : np.ndarray
+        Elevation angles in degrees, of shape (n,)
+    vis_threshold : float
+        Visibility threshold in degrees
+
+    Returns
+    -------
+    (rise_times, set_times)
+        Julian dates of the start and end of each window. Windows which are
+        open at the start or end of the series are clipped to it.
+    """
+    if len(julian) == 0:
+        return np.empty(0), np.empty(0)
+
+    above = elevation > vis_threshold
+    edges = np.diff(above.astype(np.int8))
+
+    rise_times = _crossing_times(
+        julian, elevation, np.flatnonzero(edges == 1), vis_threshold
+    )
+    set_times = _crossing_times(
+        julian, elevation, np.flatnonzero(edges == -1), vis_threshold
+    )
+
+    if above[0]:
+        rise_times = np.insert(rise_times, 0, julian[0])
+    if above[-1]:
+        set_times = np.append(set_times, julian[-1])
+
+    return rise_times, set_times
+
+
+def _crossing_times(
+    julian: np.ndarray, elevation: np.ndarray, idx: np.ndarray, vis_threshold: float
+) -> np.ndarray:
+    """Linearly interpolate the threshold crossing between samples idx and idx + 1."""
+    frac = (vis_threshold - elevation[idx]) / (elevation[idx + 1] - elevation[idx])
+    return julian[idx] + frac * (julian[idx + 1] - julian[idx])
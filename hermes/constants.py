@@ -1,7 +1,7 @@
 from celest import units as u
 from celest.coordinates import GroundLocation
 
-TORONTO_GS = toronto = GroundLocation(
+TORONTO_GS = GroundLocation(
     latitude=43.6532,
     longitude=-79.3832,
     height=76,
@@ -11,3 +11,4 @@ TORONTO_GS = toronto = GroundLocation(
 
 TORONTO_GS_OCCULSION_ANGLE = 45  # deg
 GM = 3.986004418e14  # m^3/s^2
+OMEGA_EARTH = 7.2921150e-5  # rad/s
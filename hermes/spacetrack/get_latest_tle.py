@@ -1,17 +1,46 @@
+from __future__ import annotations
+
+from typing import Iterable
+
 from spacetrack import SpaceTrackClient
 from decouple import config
 
+from hermes.tle import TLE
+
+
+def _client() -> SpaceTrackClient:
+    identity = config("SPACETRACK_EMAIL")
+    password = config("SPACETRACK_PASSWORD")
+
+    return SpaceTrackClient(identity=identity, password=password)
+
 
 def get_latest_tle(satellite_id: int) -> tuple[str, str]:
     """
     Get the latest TLE for a given satellite ID.
     """
 
-    identity = config("SPACETRACK_EMAIL")
-    password = config("SPACETRACK_PASSWORD")
-
-    st = SpaceTrackClient(identity=identity, password=password)
+    st = _client()
 
     # Note: this is being deprecated soon, find a workaround later using .gp
     raw_str: str = st.tle_latest(norad_cat_id=satellite_id, ordinal=1, format="tle")
     return raw_str.splitlines()
+
+
+def get_latest_tles(satellite_ids: Iterable[int]) -> dict[int, TLE]:
+    """
+    Get the latest TLEs for several satellite IDs.
+
+    All satellites are fetched with a single Space-Track query.
+    """
+
+    st = _client()
+
+    # Note: this is being deprecated soon, find a workaround later using .gp
+    raw_str: str = st.tle_latest(
+        norad_cat_id=list(satellite_ids), ordinal=1, format="tle"
+    )
+    lines = raw_str.splitlines()
+
+    tles = (TLE.from_lines(*pair) for pair in zip(lines[0::2], lines[1::2]))
+    return {int(tle.norad): tle for tle in tles}
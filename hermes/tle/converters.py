@@ -1,3 +1,6 @@
+_CHECKSUM_DIGITS = tuple((d, str(d)) for d in range(1, 10))
+
+
 def line_checksum(line: str) -> int:
     """
     Computes a checksum for line based on the following rules
@@ -7,13 +10,15 @@ def line_checksum(line: str) -> int:
 
     Returns mod10 of the sum.
     """
-    return (sum(int(c) for c in line if c.isdigit()) + line.count("-")) % 10
+    # str.count runs in C, so ten counts beat a per-character Python loop
+    digit_sum = sum(d * line.count(c) for d, c in _CHECKSUM_DIGITS)
+    return (digit_sum + line.count("-")) % 10
 
 
 def parse_decimal(s: str) -> float:
     """Parse a floating point with implicit leading dot.
 
-    >>> _parse_decimal('378')
+    >>> parse_decimal('378')
     0.378
     """
     return float("." + s)
@@ -23,8 +28,8 @@ def print_decimal(f: float) -> str:
     """
     prints a float without leading "0."
 
-    >>> _print_decimal(0.378)
-    "378"
+    >>> print_decimal(0.378)
+    '3780000'
     """
     return f"{f:.7f}"[2:]
 
@@ -32,11 +37,11 @@ def print_decimal(f: float) -> str:
 def parse_float(s: str) -> float:
     """Parse a floating point with implicit dot and exponential notation.
 
-    >>> _parse_float(' 12345-3')
+    >>> parse_float(' 12345-3')
     0.00012345
-    >>> _parse_float('+12345-3')
+    >>> parse_float('+12345-3')
     0.00012345
-    >>> _parse_float('-12345-3')
+    >>> parse_float('-12345-3')
     -0.00012345
     """
     return float(s[0] + "." + s[1:6] + "e" + s[6:8])
@@ -45,11 +50,11 @@ def parse_float(s: str) -> float:
 def print_float(f: float) -> str:
     """Prints a floating point with implicit dot and exponential notation.
 
-    >>> _print_float(0.00012345)
-    "12345-3"
+    >>> print_float(0.00012345)
+    '12345-3'
 
-    >>> _print_float(0)
-    "00000-0"
+    >>> print_float(0)
+    '00000-0'
     """
     s = f"{f:.4e}"
     numeric_portion = int(s[0] + s[2:6])
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import cached_property
 from types import SimpleNamespace
 
 import numpy as np
@@ -12,14 +14,84 @@ from .converters import (
     line_checksum,
     parse_decimal,
     parse_float,
-    print_decimal,
     print_float,
 )
 
 EARTH = SimpleNamespace(mu=GM)
 
+# Fixed-column layouts of the two TLE lines, without the trailing checksum
+_LINE_1_TEMPLATE = "1 {}{} {} {}{:012.8f}  {}  {}  {} 0  {}"
+_LINE_2_TEMPLATE = "2 {} {:8.4f} {:8.4f} {} {:8.4f} {:8.4f} {:11.8f}{:5d}"
 
-@dataclass
+
+def _solve_kepler(M: np.ndarray, e: float) -> np.ndarray:
+    """Solve Kepler's equation for the eccentric anomaly, elementwise.
+
+    Uses Markley's non-iterative solver (Markley, 1995), which is pure
+    arithmetic and therefore broadcasts over arrays of mean anomaly.
+
+    Parameters
+    ----------
+    M : np.ndarray
+        Mean anomaly in radians
+    e : float
+        Eccentricity (elliptical orbits only)
+
+    Returns
+    -------
+    np.ndarray
+        Eccentric anomaly in radians, in [-pi, pi)
+    """
+    M = np.remainder(M + np.pi, 2 * np.pi) - np.pi
+
+    # Starter from the cubic approximation
+    alpha = (3 * np.pi**2 + 1.6 * np.pi * (np.pi - np.abs(M)) / (1 + e)) / (
+        np.pi**2 - 6
+    )
+    d = 3 * (1 - e) + alpha * e
+    q = 2 * alpha * d * (1 - e) - M**2
+    r = 3 * alpha * d * (d - 1 + e) * M + M**3
+    w = (np.abs(r) + np.sqrt(q**3 + r**2)) ** (2 / 3)
+    E = (2 * r * w / (w**2 + w * q + q**2) + M) / d
+
+    # Fifth-order correction
+    f2 = e * np.sin(E)
+    f3 = e * np.cos(E)
+    f0 = E - f2 - M
+    f1 = 1 - f3
+    d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+    d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3**2 * f3 / 6)
+    d5 = -f0 / (f1 + 0.5 * d4 * f2 + d4**2 * f3 / 6 - d4**3 * f2 / 24)
+
+    return E + d5
+
+
+def _perifocal_axes(
+    inc: float, raan: float, argp: float
+) -> tuple[tuple[float, float, float], tuple[float, float, float]]:
+    """ECI components of the perifocal P and Q unit vectors (angles in radians).
+
+    These are the first two columns of the perifocal -> ECI rotation matrix;
+    the W column is not needed since perifocal states have no W component.
+    """
+    s_i, c_i = math.sin(inc), math.cos(inc)
+    s_raan, c_raan = math.sin(raan), math.cos(raan)
+    s_argp, c_argp = math.sin(argp), math.cos(argp)
+
+    p_hat = (
+        c_raan * c_argp - s_raan * s_argp * c_i,
+        s_raan * c_argp + c_raan * s_argp * c_i,
+        s_argp * s_i,
+    )
+    q_hat = (
+        -c_raan * s_argp - s_raan * c_argp * c_i,
+        -s_raan * s_argp + c_raan * c_argp * c_i,
+        c_argp * s_i,
+    )
+    return p_hat, q_hat
+
+
+@dataclass(frozen=True)
 class TLE:
     """Data class representing a single TLE.
 
@@ -28,6 +100,8 @@ class TLE:
 
     All the attributes parsed from the TLE are expressed in the same units that
     are used in the TLE format.
+
+    TLEs are immutable, so derived quantities are computed once and cached.
     """
 
     # NORAD catalog number (https://en.wikipedia.org/wiki/Satellite_Catalog_Number)
@@ -77,31 +151,29 @@ class TLE:
             rev_num=int(line2[63:68]),
         )
 
-    @property
+    @cached_property
     def epoch(self) -> np.datetime64:
         """Epoch of the TLE, as a numpy datetime64 object."""
-        if not hasattr(self, "_epoch"):
-            year = np.datetime64(self.epoch_year - 1970, "Y")
-            day = np.timedelta64(int((self.epoch_day - 1) * 86400 * 10**6), "us")
-            self._epoch = year + day
-        return self._epoch
+        year = np.datetime64(self.epoch_year - 1970, "Y")
+        day = np.timedelta64(int((self.epoch_day - 1) * 86400 * 10**6), "us")
+        return year + day
 
-    @property
+    @cached_property
     def cartesian_state(self) -> tuple[np.ndarray, np.ndarray]:
         """
         Current cartesian state of the satellite,
         in Earth-centered inertial frame, as m and m/s
         """
-        # Get missing orbital elements
-        a = (GM / (self.n * 2 * np.pi / 86400) ** 2) ** (1 / 3)
-        true_anomaly = lib.theta_from_M(np.deg2rad(self.M), self.ecc)
+        # Get missing orbital elements (plain floats, so scalar math is used)
+        a = (GM / (self.n * 2 * math.pi / 86400) ** 2) ** (1 / 3)
+        true_anomaly = lib.theta_from_M(math.radians(self.M), self.ecc)
 
         keplerian_elements = KeplerianElements(
             semi_major_axis=a,
             eccentricity=self.ecc,
-            inclination=np.deg2rad(self.inc),
-            longitude_of_ascending_node=np.deg2rad(self.raan),
-            argument_of_periapsis=np.deg2rad(self.argp),
+            inclination=math.radians(self.inc),
+            longitude_of_ascending_node=math.radians(self.raan),
+            argument_of_periapsis=math.radians(self.argp),
             true_anomaly=true_anomaly,
             epoch=0,
         )
@@ -111,7 +183,54 @@ class TLE:
 
         return (sv.position, sv.velocity)
 
-    @property
+    def cartesian_states_at(self, times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cartesian states of the satellite at several times after the epoch,
+        in Earth-centered inertial frame, as m and m/s
+
+        Only the mean anomaly advances (two-body motion), so all states are
+        computed in a single vectorized pass.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Time since epoch in seconds, of shape (n,)
+
+        Returns
+        -------
+        (positions, velocities), each of shape (n, 3)
+        """
+        times = np.asarray(times, dtype=np.float64)
+
+        mean_motion = self.n * 2 * math.pi / 86400  # rad/s
+        a = (GM / mean_motion**2) ** (1 / 3)
+        e = self.ecc
+
+        E = _solve_kepler(math.radians(self.M) + mean_motion * times, e)
+        sin_E, cos_E = np.sin(E), np.cos(E)
+
+        # Perifocal components written directly in terms of E, which avoids
+        # going through the true anomaly
+        beta = math.sqrt(1 - e**2)
+        x_pqw = a * (cos_E - e)
+        y_pqw = a * beta * sin_E
+        v_scale = math.sqrt(GM / a) / (1 - e * cos_E)
+        vx_pqw = -v_scale * sin_E
+        vy_pqw = v_scale * beta * cos_E
+
+        # Fused perifocal -> ECI rotation: r = x P + y Q, v = vx P + vy Q
+        p_hat, q_hat = _perifocal_axes(
+            math.radians(self.inc), math.radians(self.raan), math.radians(self.argp)
+        )
+        positions = np.empty(E.shape + (3,))
+        velocities = np.empty(E.shape + (3,))
+        for k in range(3):
+            positions[..., k] = x_pqw * p_hat[k] + y_pqw * q_hat[k]
+            velocities[..., k] = vx_pqw * p_hat[k] + vy_pqw * q_hat[k]
+
+        return (positions, velocities)
+
+    @cached_property
     def tle_string(self) -> tuple[str, str]:
         epoch_yr = (
             self.epoch_year - 2000
@@ -119,8 +238,27 @@ class TLE:
             else self.epoch_year - 1900
         )
 
-        line_1 = f"""1 {self.norad}{self.classification} {self.int_desig} {epoch_yr}{self.epoch_day:012.8f}  {f'{self.dn_o2:.8f}'[1:]}  {print_float(self.ddn_o6)}  {print_float(self.bstar)} 0  {self.set_num}"""
-        line_2 = f"""2 {self.norad} {self.inc:8.4f} {self.raan:8.4f} {print_decimal(self.ecc)} {self.argp:8.4f} {self.M:8.4f} {self.n:11.8f}{self.rev_num:5d}"""
+        line_1 = _LINE_1_TEMPLATE.format(
+            self.norad,
+            self.classification,
+            self.int_desig,
+            epoch_yr,
+            self.epoch_day,
+            format(self.dn_o2, ".8f")[1:],
+            print_float(self.ddn_o6),
+            print_float(self.bstar),
+            self.set_num,
+        )
+        line_2 = _LINE_2_TEMPLATE.format(
+            self.norad,
+            self.inc,
+            self.raan,
+            format(self.ecc, ".7f")[2:],  # implicit leading "0."
+            self.argp,
+            self.M,
+            self.n,
+            self.rev_num,
+        )
 
         # compute checksums
         line_1 += str(line_checksum(line_1))
@@ -169,11 +307,11 @@ class TLE:
             ddn_o6=dummy_tle.ddn_o6,
             bstar=dummy_tle.bstar,
             set_num=dummy_tle.set_num,
-            inc=np.rad2deg(ke.inclination),
-            raan=np.rad2deg(ke.longitude_of_ascending_node),
+            inc=math.degrees(ke.inclination),
+            raan=math.degrees(ke.longitude_of_ascending_node),
             ecc=ke.eccentricity,
-            argp=np.rad2deg(ke.argument_of_periapsis),
-            M=np.rad2deg(lib.M_from_theta(ke.true_anomaly, ke.eccentricity)),
+            argp=math.degrees(ke.argument_of_periapsis),
+            M=math.degrees(lib.M_from_theta(ke.true_anomaly, ke.eccentricity)),
             n=mean_motion,
             rev_num=dummy_tle.rev_num,
         )
@@ -1,6 +1,146 @@
-from datetime import datetime
+from __future__ import annotations
 
+import re
+from functools import lru_cache
 
+import numpy as np
+
+_USEC_PER_DAY = 86_400_000_000
+_EPOCH_1900_ORDINAL = 693596  # datetime(1900, 1, 1).toordinal()
+_J2000_DT64 = np.datetime64("2000-01-01T12:00:00", "us")
+_J2000_JD = 2451545.0
+
+# Field widths follow strptime's "%j:%H:%M:%S.%f"
+_EPOCH_TS_RE = re.compile(
+    r"(\d{1,3}):(\d{1,2}):(\d{1,2}):(\d{1,2})\.(\d{1,6})", re.ASCII
+)
+_ZERO = ord("0")
+_NINE = ord("9")
+_POW10 = 10 ** np.arange(7, dtype=np.int64)
+
+# Below this many timestamps, _parse_ts_batch parses them one by one
+_MIN_BATCH_SIZE = 32
+
+
+@lru_cache(maxsize=16)
+def _jd_base(calendar_year: int) -> float:
+    """JD of day-of-year 0 of the HERON epoch, incl. the 0.5d jd offset."""
+    # day-of-year counts from Jan 1 of 1900, as strptime without a year did
+    return _EPOCH_1900_ORDINAL - 1 + 1766349.5 - (calendar_year - 2023) * 365
+
+
+_JD_BASE_2023 = _jd_base(2023)
+
+
+def _parse_ts(epoch_ts: str) -> tuple[int, int, int, int, int]:
+    """
+    Split a "day:hour:minute:second.microsecond" timestamp into integers.
+
+    Like strptime's %f, the fractional seconds may have fewer than 6 digits,
+    and like strptime, out-of-range fields are rejected.
+    """
+    match = _EPOCH_TS_RE.fullmatch(epoch_ts)
+    if match is not None:
+        day, hour, minute, second = (int(field) for field in match.groups()[:4])
+        if _fields_in_range(day, hour, minute, second):
+            return day, hour, minute, second, int(match[5].ljust(6, "0"))
+
+    raise ValueError(
+        f"timestamp {epoch_ts!r} does not match format "
+        "'day:hour:minute:second.microsecond'"
+    )
+
+
+def _fields_in_range(
+    day: int | np.ndarray,
+    hour: int | np.ndarray,
+    minute: int | np.ndarray,
+    second: int | np.ndarray,
+) -> bool | np.ndarray:
+    """
+    Whether timestamp fields are within strptime's ranges, elementwise.
+
+    strptime accepts day-of-year 1-366; datetime rejects leap seconds.
+    """
+    return (1 <= day) & (day <= 366) & (hour < 24) & (minute < 60) & (second < 60)
+
+
+def _parse_ts_to_doy_and_frac(epoch_ts: str) -> tuple[int, float]:
+    """
+    Parse a timestamp into its day-of-year and fraction of the day.
+
+    Shared by `jd_0_from_epoch_ts` and `day_frac_from_epoch_ts`.
+    """
+    doy, hour, minute, second, microsecond = _parse_ts(epoch_ts)
+    # exact integer microseconds; only the conversion to days rounds
+    usec_of_day = (hour * 3600 + minute * 60 + second) * 1_000_000 + microsecond
+    return doy, usec_of_day / _USEC_PER_DAY
+
+
+def _as_str(ts: str | bytes) -> str:
+    """Element of a "S" or "U" timestamp array, as a str."""
+    return ts.decode(errors="replace") if isinstance(ts, bytes) else str(ts)
+
+
+def _parse_ts_batch(epoch_ts: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Vectorized `_parse_ts` over an array of timestamps, as int64 arrays.
+
+    The timestamps are viewed as a (n, width) array of character codes. Rows with
+    the same layout (positions of digits and separators) share their field
+    columns, so each layout is validated once with `_EPOCH_TS_RE` and its
+    fields are read with fixed-width digit arithmetic.
+    """
+    raw = np.asarray(epoch_ts)
+    if raw.ndim != 1:
+        raise ValueError(f"expected a 1-d array of timestamps, got shape {raw.shape}")
+    if raw.dtype.kind != "S":
+        raw = raw.astype(str, copy=False)
+    raw = np.ascontiguousarray(raw)
+    if len(raw) < _MIN_BATCH_SIZE:
+        # numpy call overhead dominates for a handful of timestamps
+        parsed = [_parse_ts(_as_str(ts)) for ts in raw.tolist()]
+        return tuple(np.array(parsed, dtype=np.int64).reshape(-1, 5).T)
+
+    fields = np.zeros((5, len(raw)), dtype=np.int64)
+
+    # one code unit per character: bytes for "S" arrays, UCS4 for "U" arrays
+    code_unit = np.uint8 if raw.dtype.kind == "S" else np.uint32
+    buf = raw.view(code_unit).reshape(len(raw), -1)
+    layout = np.where((buf >= _ZERO) & (buf <= _NINE), _ZERO, buf)
+
+    # nearly always a single layout, which skips the grouping sort
+    if (layout == layout[0]).all():
+        groups = [(layout[0], slice(None))]
+    else:
+        templates, inverse = np.unique(layout, axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        groups = [(template, inverse == k) for k, template in enumerate(templates)]
+
+    for template, rows in groups:
+        match = _EPOCH_TS_RE.fullmatch("".join(map(chr, template)).rstrip("\0"))
+        if match is None:
+            # raises for the first timestamp with this layout
+            _parse_ts(_as_str(raw[rows][0]))
+
+        for k in range(5):
+            start, stop = match.span(k + 1)
+            digits = buf[rows, start:stop].astype(np.int64) - _ZERO
+            fields[k, rows] = digits @ _POW10[stop - start - 1 :: -1]
+
+        # like strptime's %f, fewer than 6 fractional digits are right-padded
+        frac_start, frac_stop = match.span(5)
+        fields[4, rows] *= _POW10[6 - (frac_stop - frac_start)]
+
+    in_range = _fields_in_range(*fields[:4])
+    if not in_range.all():
+        # raises for the first out-of-range timestamp
+        _parse_ts(_as_str(raw[np.argmin(in_range)]))
+
+    return tuple(fields)
+
+
+@lru_cache(maxsize=None)
 def jd_0_from_epoch_ts(epoch_ts: str, calendar_year: int) -> float:
     """
     Get the JD2000 epoch from the timestamp in the HERON epoch.
@@ -8,7 +148,8 @@ def jd_0_from_epoch_ts(epoch_ts: str, calendar_year: int) -> float:
     Parameters
     ----------
     epoch_ts : str
-        Timestamp in the HERON epoch, in the format "day:hour:minute:second.microsecond".
+        Timestamp in the HERON epoch, in the format
+        "day:hour:minute:second.microsecond".
     calendar_year : int, optional
         Calendar year of the HERON epoch
 
@@ -19,24 +160,47 @@ def jd_0_from_epoch_ts(epoch_ts: str, calendar_year: int) -> float:
 
     Notes
     -----
-    May not work for other calendar years (not validated)
-    """
-    dt = datetime.strptime(epoch_ts, "%j:%H:%M:%S.%f")
-    day = (
-        dt.toordinal()
-        + dt.hour / 24
-        + dt.minute / (24 * 60)
-        + dt.second / 86400
-        + dt.microsecond / 86400e6
-    )
-    day += 0.5  # 0.5d jd offset
+    Only exact for 2023. The calendar year offset is kept from the original
+    strptime implementation and subtracts 365 days per year after 2023, so for
+    other years the result disagrees with `epoch_ts_to_datetime64` and
+    `datetime64_to_jd`, which follow the calendar. For example, "001:00:00:00.0"
+    in 2024 gives 2459580.5 here and 2460310.5 through datetime64.
+    """
+    doy, frac = _parse_ts_to_doy_and_frac(epoch_ts)
+
+    # calendar year offset; 2023 (the HERON epoch year) skips the lookup
+    base = _JD_BASE_2023 if calendar_year == 2023 else _jd_base(calendar_year)
+    return doy + frac + base
+
+
+def jd_0_from_epoch_ts_batch(epoch_ts: np.ndarray, calendar_year: int) -> np.ndarray:
+    """
+    Get the JD2000 epochs from an array of timestamps in the HERON epoch.
+
+    Vectorized equivalent of `jd_0_from_epoch_ts`, for converting many epochs
+    at once. Shares its year offset, which is only exact for 2023.
+
+    Parameters
+    ----------
+    epoch_ts : np.ndarray
+        Timestamps in the HERON epoch, in the format
+        "day:hour:minute:second.microsecond", of shape (n,)
+    calendar_year : int
+        Calendar year of the HERON epoch
 
-    # calendar year offset
-    day += 1766349 - (calendar_year - 2023) * 365
+    Returns
+    -------
+    np.ndarray
+        JD2000 epochs, of shape (n,)
+    """
+    doy, hour, minute, second, microsecond = _parse_ts_batch(epoch_ts)
+    # exact integer microseconds; only the conversion to days rounds
+    usec_of_day = (hour * 3600 + minute * 60 + second) * 1_000_000 + microsecond
 
-    return day
+    return doy + usec_of_day / _USEC_PER_DAY + _jd_base(calendar_year)
 
 
+@lru_cache(maxsize=None)
 def day_frac_from_epoch_ts(epoch_ts: str) -> float:
     """
     Get the day fraction from the timestamp in the HERON epoch.
@@ -46,22 +210,68 @@ def day_frac_from_epoch_ts(epoch_ts: str) -> float:
     Parameters
     ----------
     epoch_ts : str
-        Timestamp in the HERON epoch, in the format "day:hour:minute:second.microsecond".
+        Timestamp in the HERON epoch, in the format
+        "day:hour:minute:second.microsecond".
 
     Returns
     -------
     float
         Calendar year and day fraction
     """
-    dt = datetime.strptime(epoch_ts, "%j:%H:%M:%S.%f")
-    day = (
-        dt.toordinal()
-        - datetime(1900, 1, 1).toordinal()
-        + dt.hour / 24
-        + dt.minute / (24 * 60)
-        + dt.second / 86400
-        + dt.microsecond / 86400e6
+    doy, frac = _parse_ts_to_doy_and_frac(epoch_ts)
+    return doy - 1 + frac
+
+
+def epoch_ts_to_datetime64(epoch_ts: str, calendar_year: int) -> np.datetime64:
+    """
+    Get the epoch from the timestamp in the HERON epoch, as a datetime64.
+
+    Keeping the epoch as integer microseconds avoids rounding error until it
+    is converted to a Julian date with `datetime64_to_jd`.
+
+    Parameters
+    ----------
+    epoch_ts : str
+        Timestamp in the HERON epoch, in the format
+        "day:hour:minute:second.microsecond".
+    calendar_year : int
+        Calendar year of the HERON epoch
+
+    Returns
+    -------
+    np.datetime64
+        Epoch with microsecond resolution
+
+    Notes
+    -----
+    The day-of-year is counted from Jan 1 of `calendar_year`, so for years
+    other than 2023 this does not agree with `jd_0_from_epoch_ts`, whose year
+    offset is only exact for 2023 (see its notes). Switching a caller from
+    `jd_0_from_epoch_ts` to this path changes its JDs for other years.
+    """
+    doy, hour, minute, second, microsecond = _parse_ts(epoch_ts)
+    usec_of_day = (hour * 3600 + minute * 60 + second) * 1_000_000 + microsecond
+
+    return (
+        np.datetime64(f"{calendar_year:04d}-01-01", "us")
+        + np.timedelta64(doy - 1, "D")
+        + np.timedelta64(usec_of_day, "us")
     )
-    print(day)
 
-    return day
+
+def datetime64_to_jd(dt64: np.ndarray) -> np.ndarray:
+    """
+    Convert datetime64 epochs (scalar or array) to Julian dates.
+
+    Parameters
+    ----------
+    dt64 : np.ndarray
+        Epochs as datetime64
+
+    Returns
+    -------
+    np.ndarray
+        Julian dates in the JD2000 epoch
+    """
+    usec_since_j2000 = (dt64 - _J2000_DT64).astype("timedelta64[us]").astype(np.int64)
+    return usec_since_j2000 / _USEC_PER_DAY + _J2000_JD
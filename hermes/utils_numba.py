@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import numpy as np
+
+from hermes.utils import _USEC_PER_DAY, _jd_base, jd_0_from_epoch_ts_batch
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # optional dependency, fall back to the NumPy path
+
+    def njit(*args, **kwargs):
+        return lambda f: f
+
+    HAVE_NUMBA = False
+
+# no reassociation or reciprocal approximations, so results stay bit-identical
+# to `jd_0_from_epoch_ts_batch`
+_FASTMATH_FLAGS = {"nnan", "ninf", "nsz"}
+
+_COLON = ord(":")
+_DOT = ord(".")
+_ZERO = ord("0")
+_NINE = ord("9")
+_FORMAT_ERROR = "timestamp does not match format 'day:hour:minute:second.microsecond'"
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _parse_many(buf: np.ndarray, day_offset: float) -> np.ndarray:
+    """
+    Convert null-padded ASCII timestamps to JD2000 epochs.
+
+    Parameters
+    ----------
+    buf : np.ndarray
+        uint8 array of shape (n, width), one "day:hour:minute:second.microsecond"
+        timestamp per row, padded with zero bytes
+    day_offset : float
+        JD2000 epoch of day-of-year 0 of the HERON epoch
+
+    Returns
+    -------
+    np.ndarray
+        JD2000 epochs, of shape (n,)
+    """
+    n, width = buf.shape
+    out = np.empty(n)
+
+    for i in range(n):
+        # scalar accumulators, so the row loop does not allocate
+        day = hour = minute = second = frac_second = 0
+        field = 0
+        n_digits = 0
+
+        for j in range(width):
+            c = buf[i, j]
+            if c == 0:
+                # padding may only trail the timestamp
+                for k in range(j, width):
+                    if buf[i, k] != 0:
+                        raise ValueError(_FORMAT_ERROR)
+                break
+
+            if (c == _COLON and field < 3) or (c == _DOT and field == 3):
+                if n_digits == 0:
+                    raise ValueError(_FORMAT_ERROR)
+                field += 1
+                n_digits = 0
+            elif _ZERO <= c <= _NINE:
+                # field widths follow _EPOCH_TS_RE
+                n_digits += 1
+                max_digits = 3 if field == 0 else 6 if field == 4 else 2
+                if n_digits > max_digits:
+                    raise ValueError(_FORMAT_ERROR)
+
+                digit = c - _ZERO
+                if field == 0:
+                    day = day * 10 + digit
+                elif field == 1:
+                    hour = hour * 10 + digit
+                elif field == 2:
+                    minute = minute * 10 + digit
+                elif field == 3:
+                    second = second * 10 + digit
+                else:
+                    frac_second = frac_second * 10 + digit
+            else:
+                raise ValueError(_FORMAT_ERROR)
+
+        if field != 4 or n_digits == 0:
+            raise ValueError(_FORMAT_ERROR)
+        # same ranges as hermes.utils._fields_in_range
+        if not (1 <= day <= 366 and hour < 24 and minute < 60 and second < 60):
+            raise ValueError(_FORMAT_ERROR)
+
+        microsecond = frac_second * 10 ** (6 - n_digits)
+        usec_of_day = (hour * 3600 + minute * 60 + second) * 1_000_000 + microsecond
+
+        out[i] = day + usec_of_day / _USEC_PER_DAY + day_offset
+
+    return out
+
+
+def jd_0_from_epoch_ts_many(epoch_ts: list[str], calendar_year: int) -> np.ndarray:
+    """
+    Get the JD2000 epochs from many timestamps in the HERON epoch.
+
+    Numba-compiled equivalent of `hermes.utils.jd_0_from_epoch_ts_batch`,
+    for bulk conversions of large archives. Falls back to the NumPy
+    implementation when Numba is not installed.
+
+    Parameters
+    ----------
+    epoch_ts : list[str]
+        Timestamps in the HERON epoch, in the format
+        "day:hour:minute:second.microsecond".
+    calendar_year : int
+        Calendar year of the HERON epoch
+
+    Returns
+    -------
+    np.ndarray
+        JD2000 epochs, of shape (n,)
+    """
+    if not HAVE_NUMBA:
+        return jd_0_from_epoch_ts_batch(np.asarray(epoch_ts), calendar_year)
+
+    # compiled on first call, then loaded from the on-disk cache
+    raw = np.array(epoch_ts, dtype="S")
+    buf = raw.view(np.uint8).reshape(len(raw), raw.dtype.itemsize)
+
+    return _parse_many(buf, _jd_base(calendar_year))
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta
+import re
+
+from celest import units as u
+from celest.coordinates import GCRS, ITRS, Coordinate
+from celest.encounter import generate_vtws
+from celest.satellite import Satellite
+from celest.time import Time
+
+from hermes import celest_helpers
+from hermes.celest_helpers import (
+    _elevation_series,
+    _visible_windows,
+    ecef_to_eci,
+    ecef_to_eci_batch,
+    process_encounters,
+)
+from hermes.constants import GM, OMEGA_EARTH, TORONTO_GS
+import pytest
+import numpy as np
+
+HERON_Y0_ECEF = np.array(
+    [+4459305.633, +4513784.109, -2669611.145, +3146.340, +1002.139, +6943.597]
+)
+JD_0 = 2460218.77943716
+
+
+def _itrs_to_gcrs(jd: float, points: np.ndarray) -> np.ndarray:
+    """Reference celest ITRS -> GCRS rotation of (k, 3) points at one epoch."""
+    itrs = ITRS(np.full(len(points), jd), *points.T, u.m)
+    return Coordinate(itrs).convert_to(GCRS).to_numpy(u.m)
+
+
+def test_ecef_to_eci_batch_matches_reference():
+    y_ecef = np.vstack((HERON_Y0_ECEF, -HERON_Y0_ECEF, 2 * HERON_Y0_ECEF))
+    jd = JD_0 + np.array([0.0, 0.25, 10.0])
+
+    y_eci = ecef_to_eci_batch(y_ecef, jd)
+
+    assert y_eci.shape == (3, 6)
+    for row, (y, t) in enumerate(zip(y_ecef, jd)):
+        r_ecef, v_ecef = y[:3], y[3:]
+
+        # position: direct conversion of the position columns
+        r_ref = _itrs_to_gcrs(t, r_ecef[np.newaxis])[0]
+        assert y_eci[row, :3] == pytest.approx(r_ref, abs=1e-6)
+
+        # velocity: R v + R (w x r), with R from the rotated ITRS basis
+        R = _itrs_to_gcrs(t, np.eye(3)).T
+        omega = np.array([0.0, 0.0, OMEGA_EARTH])
+        v_ref = R @ v_ecef + R @ np.cross(omega, r_ecef)
+        assert y_eci[row, 3:] == pytest.approx(v_ref, abs=1e-6)
+
+        assert ecef_to_eci(y, t) == pytest.approx(y_eci[row], abs=1e-6)
+
+
+def test_ecef_to_eci_rotating_frame_velocity():
+    radius = 6_378_137.0
+
+    # A point fixed on the equator moves with the Earth's surface
+    y_eci = ecef_to_eci(np.array([radius, 0.0, 0.0, 0.0, 0.0, 0.0]), JD_0)
+    r_eci, v_eci = y_eci[:3], y_eci[3:]
+
+    assert np.linalg.norm(r_eci) == pytest.approx(radius)
+    assert np.linalg.norm(v_eci) == pytest.approx(OMEGA_EARTH * radius)
+    assert np.dot(r_eci, v_eci) == pytest.approx(0.0, abs=1e-3)
+
+    # Moving westward at the surface speed cancels the Earth's rotation
+    y_ecef = np.array([radius, 0.0, 0.0, 0.0, -OMEGA_EARTH * radius, 0.0])
+    assert ecef_to_eci(y_ecef, JD_0)[3:] == pytest.approx(np.zeros(3), abs=1e-6)
+
+
+def test_visible_windows():
+    julian = JD_0 + np.arange(7.0)
+
+    # open at the first sample, one interior window, open at the last sample
+    elevation = np.array([50.0, 30.0, 10.0, 60.0, 20.0, 40.0, 60.0])
+    rise_times, set_times = _visible_windows(julian, elevation, 45.0)
+
+    # crossings are interpolated: 50 -> 30 crosses 45 a quarter of the way
+    assert rise_times - julian[0] == pytest.approx([0.0, 2.7, 5.25])
+    assert set_times - julian[0] == pytest.approx([0.25, 3.375, 6.0])
+
+
+def test_visible_windows_never_rises():
+    julian = JD_0 + np.arange(4.0)
+    elevation = np.array([-10.0, 20.0, 44.0, 5.0])
+
+    rise_times, set_times = _visible_windows(julian, elevation, 45.0)
+
+    assert len(rise_times) == len(set_times) == 0
+
+
+def test_visible_windows_empty():
+    rise_times, set_times = _visible_windows(np.empty(0), np.empty(0), 45.0)
+
+    assert len(rise_times) == len(set_times) == 0
+
+
+def _circular_orbit(step: float = 30.0) -> tuple[np.ndarray, np.ndarray]:
+    """Half a day of an ISS-like circular orbit in GCRS, sampled every step s."""
+    t = np.arange(0.0, 43200.0, step)
+    a = 6_778_137.0
+    mean_motion = np.sqrt(GM / a**3)
+    inc = np.radians(51.6)
+
+    p_hat = np.array([1.0, 0.0, 0.0])
+    q_hat = np.array([0.0, np.cos(inc), np.sin(inc)])
+    arg = mean_motion * t
+    r = a * (np.outer(np.cos(arg), p_hat) + np.outer(np.sin(arg), q_hat))
+    v = a * mean_motion * (np.outer(-np.sin(arg), p_hat) + np.outer(np.cos(arg), q_hat))
+    return t, np.hstack((r, v))
+
+
+_ENCOUNTER_RE = re.compile(r"Encounter \d+: (\S+ \S+) to (\S+ \S+)")
+
+
+def _printed_windows(capsys) -> list[tuple[datetime, datetime]]:
+    """Rise and set times printed by process_encounters."""
+    return [
+        tuple(datetime.strptime(ts, "%Y-%m-%d %H:%M:%S") for ts in match)
+        for match in _ENCOUNTER_RE.findall(capsys.readouterr().out)
+    ]
+
+
+def test_process_encounters_matches_generate_vtws(capsys):
+    step = 30.0
+    t, y = _circular_orbit(step)
+
+    process_encounters(t, y, JD_0, cutoff_angles=[10.0], location=TORONTO_GS)
+    windows = _printed_windows(capsys)
+
+    julian = Time(t / 86400, offset=JD_0).julian.data
+    satellite = Satellite(
+        position=GCRS(julian, y[:, 0], y[:, 1], y[:, 2], u.m),
+        velocity=GCRS(julian, y[:, 3], y[:, 4], y[:, 5], u.m / u.s),
+    )
+    reference = [
+        (Time(w.rise_time.data).datetime()[0], Time(w.set_time.data).datetime()[0])
+        for w in generate_vtws(satellite, TORONTO_GS, 10.0)
+    ]
+
+    # generate_vtws reports the last sample below and the last sample above
+    # the threshold; printed times are truncated to whole seconds
+    tolerance = timedelta(seconds=step + 1)
+    assert len(windows) == len(reference) > 0
+    for (rise, set_), (ref_rise, ref_set) in zip(windows, reference):
+        assert abs(rise - ref_rise) <= tolerance
+        assert abs(set_ - ref_set) <= tolerance
+
+
+def test_process_encounters_chunked(capsys, monkeypatch):
+    t, y = _circular_orbit()
+    julian = Time(t / 86400, offset=JD_0).julian.data
+
+    elevation = _elevation_series(julian, y, TORONTO_GS)
+    process_encounters(t, y, JD_0, cutoff_angles=[10.0], location=TORONTO_GS)
+    windows = _printed_windows(capsys)
+
+    chunk_size = 7
+    monkeypatch.setattr(celest_helpers, "ELEVATION_CHUNK_SIZE", chunk_size)
+
+    elevation_chunked = _elevation_series(julian, y, TORONTO_GS)
+    process_encounters(t, y, JD_0, cutoff_angles=[10.0], location=TORONTO_GS)
+
+    np.testing.assert_allclose(elevation_chunked, elevation, rtol=0, atol=1e-9)
+    assert _printed_windows(capsys) == windows
+    assert len(windows) > 0
+
+    # at least one window has samples on both sides of a chunk boundary
+    visible = np.flatnonzero(elevation > 10.0)
+    adjacent = np.diff(visible) == 1
+    crosses = visible[1:] // chunk_size != visible[:-1] // chunk_size
+    assert np.any(adjacent & crosses)
@@ -0,0 +1,158 @@
+from hermes.utils import (
+    datetime64_to_jd,
+    epoch_ts_to_datetime64,
+    jd_0_from_epoch_ts,
+    jd_0_from_epoch_ts_batch,
+)
+from hermes import utils_numba
+from hermes.utils_numba import jd_0_from_epoch_ts_many
+from datetime import datetime
+import re
+import pytest
+import numpy as np
+
+
+def test_jd_0_batch_matches_scalar():
+    timestamps = ["274:06:42:23.371", "001:00:00:00.000000", "365:23:59:59.999999"]
+
+    jd_batch = jd_0_from_epoch_ts_batch(np.array(timestamps), 2023)
+
+    assert jd_batch == pytest.approx(
+        [jd_0_from_epoch_ts(ts, 2023) for ts in timestamps], abs=1e-9
+    )
+
+
+def test_jd_0_large_batch_matches_scalar():
+    # mixed field widths, enough timestamps for the vectorized parser
+    timestamps = [f"{day}:{day % 24}:{day % 60:02d}:07.{day}" for day in range(1, 366)]
+
+    jd_batch = jd_0_from_epoch_ts_batch(np.array(timestamps), 2023)
+
+    np.testing.assert_array_equal(
+        jd_batch, [jd_0_from_epoch_ts(ts, 2023) for ts in timestamps]
+    )
+
+
+def test_jd_0_batch_empty():
+    jd_batch = jd_0_from_epoch_ts_batch(np.array([], dtype=str), 2023)
+
+    assert jd_batch.shape == (0,)
+
+
+def test_jd_0_batch_rejects_non_1d():
+    with pytest.raises(ValueError):
+        jd_0_from_epoch_ts_batch(np.array([["274:06:42:23.371"] * 2] * 2), 2023)
+
+    with pytest.raises(ValueError):
+        jd_0_from_epoch_ts_batch(np.array("274:06:42:23.371"), 2023)
+
+
+def test_jd_0_many_matches_scalar():
+    timestamps = ["274:06:42:23.371", "001:00:00:00.000000", "365:23:59:59.999999"]
+
+    jd_many = jd_0_from_epoch_ts_many(timestamps, 2023)
+
+    np.testing.assert_array_equal(
+        jd_many, [jd_0_from_epoch_ts(ts, 2023) for ts in timestamps]
+    )
+
+
+def test_epoch_ts_to_datetime64():
+    epoch = epoch_ts_to_datetime64("274:06:42:23.371", 2023)
+
+    assert epoch == np.datetime64("2023-10-01T06:42:23.371", "us")
+    assert datetime64_to_jd(epoch) == pytest.approx(
+        jd_0_from_epoch_ts("274:06:42:23.371", 2023), abs=1e-9
+    )
+
+
+def test_epoch_ts_to_datetime64_leap_year():
+    # day-of-year follows the calendar, including Feb 29
+    epoch = epoch_ts_to_datetime64("061:00:00:00.0", 2024)
+    assert epoch == np.datetime64("2024-03-01T00:00:00", "us")
+
+    epoch = epoch_ts_to_datetime64("001:00:00:00.0", 2024)
+    assert datetime64_to_jd(epoch) == pytest.approx(2460310.5, abs=1e-9)
+
+    # jd_0_from_epoch_ts keeps its 2023-only year offset
+    assert jd_0_from_epoch_ts("001:00:00:00.0", 2024) == pytest.approx(
+        2459580.5, abs=1e-9
+    )
+
+
+MALFORMED_TIMESTAMPS = [
+    "274:06:42:23",
+    "274:06:42:23.",
+    "274:06:42:23.1234567",
+    "4000:06:42:23.1",
+    "274:24:00:00.0",
+    "274:06:60:00.0",
+    "274:06:42:60.0",
+    "000:06:42:23.371",
+    "367:00:00:00.0",
+    "999:06:42:23.371",
+    "000:99:99:99.9",
+]
+
+
+@pytest.mark.parametrize("timestamp", MALFORMED_TIMESTAMPS)
+def test_malformed_timestamp_raises(timestamp):
+    with pytest.raises(ValueError):
+        jd_0_from_epoch_ts(timestamp, 2023)
+
+
+@pytest.mark.parametrize("n_valid", [0, 100])
+@pytest.mark.parametrize("timestamp", MALFORMED_TIMESTAMPS)
+def test_malformed_timestamp_raises_batch(timestamp, n_valid):
+    timestamps = ["274:06:42:23.371"] * n_valid + [timestamp]
+
+    with pytest.raises(ValueError, match=re.escape(repr(timestamp))):
+        jd_0_from_epoch_ts_batch(np.array(timestamps), 2023)
+
+
+@pytest.mark.parametrize("have_numba", [utils_numba.HAVE_NUMBA, False])
+@pytest.mark.parametrize("timestamp", MALFORMED_TIMESTAMPS)
+def test_malformed_timestamp_raises_many(timestamp, have_numba, monkeypatch):
+    monkeypatch.setattr(utils_numba, "HAVE_NUMBA", have_numba)
+
+    with pytest.raises(ValueError):
+        jd_0_from_epoch_ts_many(["274:06:42:23.371", timestamp], 2023)
+
+
+def test_jd_0_many_fallback_matches_kernel(monkeypatch):
+    timestamps = [f"{day}:{day % 24}:{day % 60:02d}:07.{day}" for day in range(1, 366)]
+    jd_many = jd_0_from_epoch_ts_many(timestamps, 2023)
+
+    monkeypatch.setattr(utils_numba, "HAVE_NUMBA", False)
+
+    np.testing.assert_array_equal(jd_0_from_epoch_ts_many(timestamps, 2023), jd_many)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    MALFORMED_TIMESTAMPS
+    + [
+        "001:00:00:00.0",
+        "366:00:00:00.0",
+        "274:23:59:59.999999",
+        "1:2:3:4.5",
+        "274:06:42:61.0",
+    ],
+)
+def test_strptime_parity(timestamp):
+    # the original implementation parsed with strptime
+    try:
+        dt = datetime.strptime(timestamp, "%j:%H:%M:%S.%f")
+    except ValueError:
+        with pytest.raises(ValueError):
+            jd_0_from_epoch_ts(timestamp, 2023)
+        return
+
+    expected = (
+        dt.toordinal()
+        + (dt.hour * 3600 + dt.minute * 60 + dt.second) / 86400
+        + dt.microsecond / 86400e6
+        + 0.5
+        + 1766349
+    )
+    assert jd_0_from_epoch_ts(timestamp, 2023) == pytest.approx(expected, abs=1e-9)
@@ -1,5 +1,5 @@
+from hermes.constants import GM
 from hermes.tle import TLE
-import pytest
 import numpy as np
 
 
@@ -12,7 +12,9 @@ def test_tle_parsing():
     tle = TLE.from_lines(*sample_tle)
 
     assert tle.norad == "25544"
-    assert tle.epoch == pytest.approx(np.datetime64("2021-02-04T12:19:04.113984", "us"))
+    assert tle.epoch.astype("datetime64[us]") == np.datetime64(
+        "2021-02-04T12:19:04.113984", "us"
+    )
 
 
 def test_tle_end_to_end():
@@ -28,3 +30,32 @@ def test_tle_end_to_end():
     new_tle = TLE.from_cartesian_state(*cart, tle, 2021, 35.51324206)
 
     assert new_tle.tle_string == tuple(sample_tle)
+
+
+def test_tle_cartesian_states_at():
+    sample_tle = [
+        "1 25544U 98067A   21035.51324206  .00001077  00000-0  27754-4 0  9998",
+        "2 25544  51.6455 278.9410 0002184 336.6191  80.6984 15.48940116268036",
+    ]
+
+    tle = TLE.from_lines(*sample_tle)
+
+    period = 86400 / tle.n
+    positions, velocities = tle.cartesian_states_at(
+        np.array([0.0, 3600.0, 0.37 * period, period])
+    )
+
+    assert positions.shape == velocities.shape == (4, 3)
+    np.testing.assert_allclose(positions[0], tle.cartesian_state[0], rtol=1e-10)
+    np.testing.assert_allclose(velocities[0], tle.cartesian_state[1], rtol=1e-10)
+
+    # Two-body motion conserves specific energy and angular momentum
+    r = np.linalg.norm(positions, axis=1)
+    energy = 0.5 * np.sum(velocities**2, axis=1) - GM / r
+    momentum = np.cross(positions, velocities)
+    np.testing.assert_allclose(energy, energy[0], rtol=1e-10)
+    np.testing.assert_allclose(momentum, np.tile(momentum[0], (4, 1)), rtol=1e-10)
+
+    # and returns to the epoch state after one period
+    np.testing.assert_allclose(positions[-1], positions[0], rtol=1e-8, atol=1e-3)
+    np.testing.assert_allclose(velocities[-1], velocities[0], rtol=1e-8, atol=1e-6)
@@ -1,4 +1,4 @@
-from hermes.spacetrack.get_latest_tle import get_latest_tle
+from hermes.spacetrack.get_latest_tle import get_latest_tle, get_latest_tles
 
 
 def test_get_latest_tle():
@@ -6,3 +6,11 @@ def test_get_latest_tle():
 
     tle = get_latest_tle(ISS_ID)
     assert "25544" in tle[0]
+
+
+def test_get_latest_tles():
+    ISS_ID = 25544
+    HST_ID = 20580
+
+    tles = get_latest_tles([ISS_ID, HST_ID])
+    assert set(tles) == {ISS_ID, HST_ID}